@@ -1,3 +1,4 @@
+import hashlib
 import subprocess
 import sys
 from pathlib import Path
@@ -6,13 +7,20 @@ PROJECT_NAME = "MetricMate"
 MAIN_SCRIPT = "gaming_analyzer_gui.py"
 ICON_PNG = "icon.png"
 REQUIREMENTS = "requirements.txt"
+DEPS_HASH = ".deps.hash"
 
 
 def install_dependencies():
     if Path(REQUIREMENTS).exists():
+        # Key the marker on the interpreter too, so a fresh venv still gets its packages
+        deps_hash = hashlib.sha256(Path(REQUIREMENTS).read_bytes() + sys.executable.encode()).hexdigest()
+        if Path(DEPS_HASH).exists() and Path(DEPS_HASH).read_text() == deps_hash:
+            print(f"[INFO] {REQUIREMENTS} unchanged since last install. Skipping dependency installation.")
+            return
         print(f"[INFO] Installing dependencies from {REQUIREMENTS}...")
         try:
-            subprocess.run([sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS], check=True)
+            subprocess.run([sys.executable, "-m", "pip", "install", "--no-input", "-r", REQUIREMENTS], check=True)
+            Path(DEPS_HASH).write_text(deps_hash)
             print("[INFO] Dependencies installed successfully.")
         except subprocess.CalledProcessError as e:
             print(f"[ERROR] Failed to install dependencies: {e}")
@@ -20,7 +28,7 @@ def install_dependencies():
     else:
         print(f"[INFO] No {REQUIREMENTS} file found. Skipping dependency installation.")
 
-def build_exe():
+def build_exe(onefile=False):
     try:
         if not Path(MAIN_SCRIPT).exists():
             print(f"[ERROR] {MAIN_SCRIPT} not found.")
@@ -30,14 +38,19 @@ def build_exe():
             sys.exit(1)
         cmd = [
             sys.executable, "-m", "PyInstaller",
-            "--onefile",
+            "--noconfirm",
+            "--clean",
             f"--icon={ICON_PNG}",
             f"--name={PROJECT_NAME}",
             MAIN_SCRIPT
         ]
+        # One-folder builds start faster; --onefile unpacks to a temp dir on every launch
+        if onefile:
+            cmd.insert(3, "--onefile")
         print(f"[INFO] Running: {' '.join(cmd)}")
         subprocess.run(cmd, check=True)
-        print(f"[INFO] Build complete. Check the dist/ folder for {PROJECT_NAME}")
+        output = f"{PROJECT_NAME}" if onefile else f"{PROJECT_NAME}/"
+        print(f"[INFO] Build complete. Check the dist/ folder for {output}")
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Build failed: {e}")
         sys.exit(1)
@@ -47,7 +60,7 @@ def build_exe():
 
 def main():
     install_dependencies()
-    build_exe()
+    build_exe(onefile="--onefile" in sys.argv[1:])
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
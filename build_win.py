@@ -1,3 +1,4 @@
+import hashlib
 import subprocess
 import sys
 import os
@@ -9,18 +10,20 @@ MAIN_SCRIPT = "gaming_analyzer_gui.py"
 ICON_PNG = "icon.png"
 ICON_ICO = "icon.ico"
 REQUIREMENTS = "requirements.txt"
+DEPS_HASH = ".deps.hash"
 
 def install_dependencies():
     """Install dependencies from requirements.txt if it exists."""
     if Path(REQUIREMENTS).exists():
-        print(f"[INFO] Found {REQUIREMENTS}. Listing dependencies:")
-        with open(REQUIREMENTS, 'r') as f:
-            deps = [line.strip() for line in f if line.strip() and not line.startswith('#')]
-        for dep in deps:
-            print(f"  - {dep}")
+        # Key the marker on the interpreter too, so a fresh venv still gets its packages
+        deps_hash = hashlib.sha256(Path(REQUIREMENTS).read_bytes() + sys.executable.encode()).hexdigest()
+        if Path(DEPS_HASH).exists() and Path(DEPS_HASH).read_text() == deps_hash:
+            print(f"[INFO] {REQUIREMENTS} unchanged since last install. Skipping dependency installation.")
+            return
         print(f"[INFO] Installing dependencies from {REQUIREMENTS}...")
         try:
-            subprocess.run([sys.executable, "-m", "pip", "install", "-r", REQUIREMENTS], check=True)
+            subprocess.run([sys.executable, "-m", "pip", "install", "--no-input", "-r", REQUIREMENTS], check=True)
+            Path(DEPS_HASH).write_text(deps_hash)
             print("[INFO] Dependencies installed successfully.")
         except subprocess.CalledProcessError as e:
             print(f"[ERROR] Failed to install dependencies: {e}")
@@ -34,6 +37,9 @@ def convert_icon():
         if not Path(ICON_PNG).exists():
             print(f"[ERROR] {ICON_PNG} not found.")
             sys.exit(1)
+        if Path(ICON_ICO).exists() and Path(ICON_ICO).stat().st_mtime >= Path(ICON_PNG).stat().st_mtime:
+            print(f"[INFO] {ICON_ICO} is up to date. Skipping conversion.")
+            return
         img = Image.open(ICON_PNG)
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
@@ -44,7 +50,7 @@ def convert_icon():
         print(f"[ERROR] Failed to convert icon: {e}")
         sys.exit(1)
 
-def build_exe():
+def build_exe(onefile=False):
     """Build the executable using PyInstaller."""
     try:
         if not Path(MAIN_SCRIPT).exists():
@@ -55,15 +61,20 @@ def build_exe():
             sys.exit(1)
         cmd = [
             sys.executable, "-m", "PyInstaller",
-            "--onefile",
+            "--noconfirm",
+            "--clean",
             "--windowed",
             f"--icon={ICON_ICO}",
             f"--name={PROJECT_NAME}",
             MAIN_SCRIPT
         ]
+        # One-folder builds start faster; --onefile unpacks to a temp dir on every launch
+        if onefile:
+            cmd.insert(3, "--onefile")
         print(f"[INFO] Running: {' '.join(cmd)}")
         subprocess.run(cmd, check=True)
-        print(f"[INFO] Build complete. Check the dist/ folder for {PROJECT_NAME}.exe")
+        output = f"{PROJECT_NAME}.exe" if onefile else f"{PROJECT_NAME}/"
+        print(f"[INFO] Build complete. Check the dist/ folder for {output}")
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Build failed: {e}")
         sys.exit(1)
@@ -74,7 +85,7 @@ def build_exe():
 def main():
     install_dependencies()
     convert_icon()
-    build_exe()
+    build_exe(onefile="--onefile" in sys.argv[1:])
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
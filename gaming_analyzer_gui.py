@@ -2,16 +2,55 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import pandas as pd
 import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
 import seaborn as sns
 from datetime import datetime, timedelta
 import numpy as np
 import os
+import re
 from pathlib import Path
-import time
+from concurrent.futures import ThreadPoolExecutor
 from tkcalendar import DateEntry
 import json
-from scipy import stats
+import csv
+import codecs
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pa_parquet
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Share of values pd.to_numeric may fail on before falling back to regex extraction
+NUMERIC_NAN_THRESHOLD = 0.5
+
+# Rows per chunk when streaming a CSV through the C parser
+CSV_CHUNK_SIZE = 200_000
+
+# Bump whenever the cleaning changes, so parquet caches written by older versions are ignored
+PARQUET_CACHE_VERSION = b'1'
+
+# Column name fragments of the time, date and metric columns read from a CSV
+ANALYSIS_COLUMN_KEYWORDS = ('time', 'date', 'temp', 'cpu', 'gpu', 'usage')
+
+# First number in a value with units attached, e.g. "45 °C"
+NUMBER_RE = re.compile(r'(-?\d+\.?\d*)')
+
+# Day-first dates written with dots, e.g. 7.5.2025
+DOTTED_DATE_RE = re.compile(r'\d{1,2}\.\d{1,2}\.\d{4}$')
+
+# Start and end of each selectable time range, end excluded
+TIME_RANGES = {
+    "Morning (6AM-12PM)": ('06:00', '12:00'),
+    "Afternoon (12PM-6PM)": ('12:00', '18:00'),
+    "Evening (6PM-12AM)": ('18:00', '00:00'),
+    "Night (12AM-6AM)": ('00:00', '06:00'),
+}
+
+# Graph types that show the correlation matrix of the metric columns
+CORRELATION_GRAPHS = ("Correlation", "Heatmap")
 
 # Tokyo Night color scheme
 TOKYO_NIGHT = {
@@ -30,6 +69,37 @@ TOKYO_NIGHT = {
     'hover': '#565f89'
 }
 
+# Minimum number of points drawn per series after downsampling
+MIN_PLOT_POINTS = 2000
+
+def _downsample(x, y, n_out):
+    """Reduce a series to n_out points with Largest-Triangle-Three-Buckets (LTTB)"""
+    valid = ~np.isnan(y)
+    x, y = x[valid], y[valid]
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+        
+    # Triangle areas need plain numbers, so datetimes are measured in their integer ticks
+    xf = x.view('int64').astype('float64') if np.issubdtype(x.dtype, np.datetime64) else x.astype('float64')
+    
+    # First and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket (or the last point) is the third triangle vertex
+        if i + 2 < len(edges):
+            next_x, next_y = xf[end:edges[i + 2]].mean(), y[end:edges[i + 2]].mean()
+        else:
+            next_x, next_y = xf[-1], y[-1]
+        area = np.abs((xf[a] - next_x) * (y[start:end] - y[a]) - (xf[a] - xf[start:end]) * (next_y - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return x[selected], y[selected]
+
 class GamingAnalyzerGUI:
     def __init__(self, root):
         self.root = root
@@ -45,13 +115,22 @@ class GamingAnalyzerGUI:
         self.df = None
         self.current_graph = None
         self.analysis_text = None
-        self.last_draw_time = 0
-        self.draw_throttle = 100  # milliseconds between redraws
+        self._temp_cols = []
+        self._cpu_cols = []
+        self._gpu_cols = []
+        self._time_col = None
+        self._stats_cache = {}
+        self._report_cache = {}
+        self._plotted_type = None
+        self._lines = []
+        self._analysis_key = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
         self.alert_thresholds = {
             'temperature': 80,  # °C
             'cpu_usage': 90,    # %
             'gpu_usage': 90     # %
         }
+        self.png_compress_level = 3  # zlib level for saved PNGs, 0 (fastest) to 9 (smallest)
         
         # Configure theme colors
         self.configure_theme()
@@ -291,59 +370,15 @@ class GamingAnalyzerGUI:
         graph_frame.grid_rowconfigure(0, weight=1)
         graph_frame.grid_columnconfigure(0, weight=1)
         
-        # Create a canvas with scrollbars
-        canvas_frame = ttk.Frame(graph_frame)
-        canvas_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Configure grid weights for canvas frame
-        canvas_frame.grid_rowconfigure(0, weight=1)
-        canvas_frame.grid_columnconfigure(0, weight=1)
-        
-        # Create canvas with double buffering
-        self.graph_canvas = tk.Canvas(canvas_frame, bg=TOKYO_NIGHT['graph_bg'], highlightthickness=0)
-        self.graph_canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-        
-        # Add scrollbars
-        y_scrollbar = ttk.Scrollbar(canvas_frame, orient=tk.VERTICAL, command=self.graph_canvas.yview)
-        y_scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
-        
-        x_scrollbar = ttk.Scrollbar(graph_frame, orient=tk.HORIZONTAL, command=self.graph_canvas.xview)
-        x_scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
-        
-        # Configure canvas
-        self.graph_canvas.configure(yscrollcommand=y_scrollbar.set, xscrollcommand=x_scrollbar.set)
-        
-        # Create frame for matplotlib figure
-        self.fig_frame = ttk.Frame(self.graph_canvas)
-        self.graph_canvas.create_window((0, 0), window=self.fig_frame, anchor=tk.NW)
-        
         # Create figure for matplotlib with optimized settings
         self.fig = plt.Figure(figsize=(8, 6), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=self.fig_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
-        
-        # Add navigation toolbar with custom styling
-        from matplotlib.backends.backend_tkagg import NavigationToolbar2Tk
-        self.toolbar = NavigationToolbar2Tk(self.canvas, self.fig_frame)
-        self.toolbar.update()
-        
-        # Configure scroll region with throttling
-        def configure_scroll_region(event):
-            current_time = int(time.time() * 1000)
-            if current_time - self.last_draw_time > self.draw_throttle:
-                self.graph_canvas.configure(scrollregion=self.graph_canvas.bbox("all"))
-                self.last_draw_time = current_time
-        
-        self.fig_frame.bind("<Configure>", configure_scroll_region)
-        
-        # Add mouse wheel scrolling with throttling
-        def _on_mousewheel(event):
-            current_time = int(time.time() * 1000)
-            if current_time - self.last_draw_time > self.draw_throttle:
-                self.graph_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-                self.last_draw_time = current_time
+        self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
-        self.graph_canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Add navigation toolbar for pan/zoom with custom styling; its view history
+        # is reset once a graph has been drawn
+        self.toolbar = NavigationToolbar2Tk(self.canvas, graph_frame, pack_toolbar=False)
+        self.toolbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         
         # Add zoom controls with custom styling
         control_frame = ttk.Frame(graph_frame)
@@ -393,179 +428,381 @@ class GamingAnalyzerGUI:
         )
         
         if file_path:
-            try:
-                # List of encodings to try
-                encodings = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252', 'iso-8859-1', 'utf-16', 'utf-16le', 'utf-16be']
-                
-                # Try different encodings
-                for encoding in encodings:
-                    try:
-                        # First try with default settings
-                        self.df = pd.read_csv(file_path, encoding=encoding, on_bad_lines='skip')
-                        break
-                    except UnicodeDecodeError:
-                        continue
-                    except Exception as e:
-                        # If we get a different error, try with different parameters
-                        try:
-                            # Try with different separators
-                            for sep in [',', ';', '\t', '|']:
-                                try:
-                                    self.df = pd.read_csv(file_path, encoding=encoding, sep=sep, on_bad_lines='skip')
-                                    if len(self.df.columns) > 1:  # Make sure we got multiple columns
-                                        break
-                                except:
-                                    continue
-                            if self.df is not None and len(self.df.columns) > 1:
-                                break
-                        except:
-                            continue
-                
-                if self.df is None:
-                    raise Exception("Could not read the file with any supported encoding")
-                
-                # Clean up the data
-                self.clean_dataframe()
-                
-                # Update UI
-                self.file_label.config(text=os.path.basename(file_path))
-                messagebox.showinfo("Success", "CSV file loaded successfully!")
-                
-            except Exception as e:
-                messagebox.showerror("Error", f"Error loading CSV file: {str(e)}")
-                self.df = None
-                
-    def clean_dataframe(self):
-        """Clean and prepare the dataframe for analysis"""
+            # Parse and clean on a worker thread so the window stays responsive
+            self.file_label.config(text=f"Loading {os.path.basename(file_path)}...")
+            future = self._executor.submit(self._load_and_clean, file_path)
+            future.add_done_callback(lambda f: self.root.after(0, self._on_loaded, file_path, f))
+            
+    def _load_and_clean(self, file_path):
+        """Read and clean a CSV file off the Tk thread, returning the cleaned dataframe"""
+        # Reuse the cleaned data from an earlier load while the CSV is unchanged
+        df = self.read_parquet_cache(file_path)
+        if df is not None:
+            return df
+            
+        # Detect the format once from a sample instead of re-parsing
+        # the whole file for every encoding/separator combination
+        encoding, sep = self.detect_csv_format(file_path)
+        
+        # Clean each chunk as it is read, then finish on the combined rows
+        chunks = [self.clean_chunk(chunk) for chunk in self.read_csv_chunks(file_path, encoding, sep)]
+        df = self.clean_dataframe(pd.concat(chunks))
+        self.write_parquet_cache(file_path, df)
+        return df
+        
+    def _on_loaded(self, file_path, future):
+        """Install a dataframe loaded by _load_and_clean, back on the Tk thread"""
+        try:
+            self.df = future.result()
+            
+            # Classify columns once so plotting and analysis don't re-scan them
+            self.classify_columns()
+            # Summary statistics and plot lines from the previous file no longer apply
+            self._stats_cache = {}
+            self._report_cache = {}
+            self._plotted_type = None
+            self._analysis_key = None
+            
+            # Update UI
+            self.file_label.config(text=os.path.basename(file_path))
+            messagebox.showinfo("Success", "CSV file loaded successfully!")
+            
+        except Exception as e:
+            self.file_label.config(text="No file selected")
+            messagebox.showerror("Error", f"Error loading CSV file: {str(e)}")
+            self.df = None
+            
+    def parquet_cache_path(self, file_path):
+        """Path of the cleaned-data cache kept next to a CSV file"""
+        path = Path(file_path)
+        return path.with_name(path.name + '.parquet')
+        
+    def read_parquet_cache(self, file_path):
+        """Return the cached cleaned dataframe for a CSV, or None if it is missing or stale"""
+        if not HAS_PYARROW:
+            return None
+        cache_path = self.parquet_cache_path(file_path)
+        try:
+            if cache_path.stat().st_mtime < os.path.getmtime(file_path):
+                return None
+            metadata = pa_parquet.read_schema(cache_path).metadata or {}
+            if metadata.get(b'metricmate_cache_version') != PARQUET_CACHE_VERSION:
+                return None
+            return pd.read_parquet(cache_path)
+        except Exception:
+            return None
+            
+    def write_parquet_cache(self, file_path, df):
+        """Save a cleaned dataframe so the next load of the same CSV can skip parsing"""
+        if not HAS_PYARROW:
+            return
         try:
-            # Remove any completely empty rows
-            self.df = self.df.dropna(how='all')
+            table = pa.Table.from_pandas(df)
+            table = table.replace_schema_metadata(
+                {**(table.schema.metadata or {}), b'metricmate_cache_version': PARQUET_CACHE_VERSION})
+            pa_parquet.write_table(table, self.parquet_cache_path(file_path), compression='zstd')
+        except Exception as e:
+            print(f"Warning: Could not write parquet cache: {str(e)}")
             
-            # Remove any completely empty columns
-            self.df = self.df.dropna(axis=1, how='all')
+    def detect_csv_format(self, file_path):
+        """Detect the encoding and separator of a CSV file from its first 64 KiB"""
+        with open(file_path, 'rb') as f:
+            sample = f.read(65536)
             
+        # Check for a byte order mark, then strict UTF-8. Anything else is read as
+        # latin1, which matches the encodings the old retry loop could ever reach
+        if sample.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
+        elif sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            encoding = 'utf-16'
+        else:
+            try:
+                codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+                encoding = 'utf-8'
+            except UnicodeDecodeError:
+                encoding = 'latin1'
+        
+        try:
+            # Only sniff complete lines so a truncated last row doesn't skew the result
+            text = sample.decode(encoding, errors='replace').rsplit('\n', 1)[0]
+            sep = csv.Sniffer().sniff(text, delimiters=',;\t|').delimiter
+        except csv.Error:
+            sep = ','
+        return encoding, sep
+        
+    def read_csv_chunks(self, file_path, encoding, sep):
+        """Read the columns the analysis uses from a CSV file with the fastest available parser,
+        yielding the rows in one or more dataframes"""
+        # The C parser numbers duplicate headers (e.g. "GPU Temperature [°C].1"), so read the header
+        # with it and keep only the time, date and metric columns
+        header = list(pd.read_csv(file_path, encoding=encoding, sep=sep, nrows=0).columns)
+        keep = [col for col in header if any(key in col.lower() for key in ANALYSIS_COLUMN_KEYWORDS)]
+        
+        # Keep time and date columns as strings until they are parsed in clean_chunk
+        text_cols = [col for col in keep if 'time' in col.lower() or 'date' in col.lower()]
+        
+        if HAS_PYARROW:
+            try:
+                # Multithreaded Arrow parser with compact Arrow-backed columns; passing the numbered
+                # header as column names keeps duplicate sensors apart
+                table = pa_csv.read_csv(
+                    file_path,
+                    read_options=pa_csv.ReadOptions(encoding=encoding, column_names=header, skip_rows=1),
+                    parse_options=pa_csv.ParseOptions(delimiter=sep, invalid_row_handler=lambda row: 'skip'),
+                    convert_options=pa_csv.ConvertOptions(include_columns=keep,
+                                                          column_types={col: pa.string() for col in text_cols}))
+            except Exception:
+                table = None  # Fall back to the C parser below
+            if table is not None:
+                yield table.to_pandas(types_mapper=pd.ArrowDtype)
+                return
+                
+        # Stream the file in chunks so peak memory is bounded by the chunk, not the file
+        dtype = {col: 'string' for col in text_cols}
+        started = False
+        try:
+            for chunk in pd.read_csv(file_path, encoding=encoding, sep=sep, engine='c', usecols=keep,
+                                     dtype=dtype, on_bad_lines='skip', chunksize=CSV_CHUNK_SIZE):
+                started = True
+                yield chunk
+        except pd.errors.ParserError:
+            if started:
+                raise
+            # Let the Python parser sniff the separator itself when the C parser cannot cope
+            yield pd.read_csv(file_path, encoding=encoding, sep=None, engine='python',
+                              usecols=keep, dtype=dtype, on_bad_lines='skip')
+        
+    def time_column(self, df):
+        """Name of the parsed time column to index by, preferring 'Time'"""
+        time_cols = [col for col in df.columns
+                     if 'time' in col.lower() and pd.api.types.is_datetime64_any_dtype(df[col])]
+        return 'Time' if 'Time' in time_cols else next(iter(time_cols), None)
+        
+    def clean_chunk(self, df):
+        """Parse and convert the columns of a chunk of rows, returning the cleaned chunk"""
+        try:
             # Clean column names
-            self.df.columns = [col.strip() for col in self.df.columns]
+            df.columns = [col.strip() for col in df.columns]
             
             # Try to identify and convert time columns
-            time_columns = [col for col in self.df.columns if 'time' in col.lower()]
-            date_columns = [col for col in self.df.columns if 'date' in col.lower()]
-            
-            # Handle time columns
-            for col in time_columns:
-                try:
-                    # Try different time formats
-                    time_formats = [
-                        '%H:%M:%S', '%H:%M:%S.%f', '%I:%M:%S %p', 
-                        '%I:%M:%S.%f %p', '%H:%M', '%I:%M %p'
-                    ]
-                    
-                    for fmt in time_formats:
-                        try:
-                            self.df[col] = pd.to_datetime(self.df[col], format=fmt)
-                            break
-                        except:
-                            continue
-                            
-                    # If none of the formats work, try general parsing
-                    if not pd.api.types.is_datetime64_any_dtype(self.df[col]):
-                        self.df[col] = pd.to_datetime(self.df[col], errors='coerce')
-                except:
-                    continue
+            time_columns = [col for col in df.columns if 'time' in col.lower()]
+            date_columns = [col for col in df.columns if 'date' in col.lower()]
             
-            # Handle date columns
-            for col in date_columns:
+            # Parse time and date columns in one pass; cache reuses repeated timestamps
+            for col in time_columns + date_columns:
                 try:
-                    # Try different date formats
-                    date_formats = [
-                        '%Y-%m-%d', '%d-%m-%Y', '%m-%d-%Y',
-                        '%Y/%m/%d', '%d/%m/%Y', '%m/%d/%Y'
-                    ]
-                    
-                    for fmt in date_formats:
-                        try:
-                            self.df[col] = pd.to_datetime(self.df[col], format=fmt)
-                            break
-                        except:
-                            continue
-                            
-                    # If none of the formats work, try general parsing
-                    if not pd.api.types.is_datetime64_any_dtype(self.df[col]):
-                        self.df[col] = pd.to_datetime(self.df[col], errors='coerce')
+                    first = df[col].dropna().astype('string').iloc[0] if df[col].notna().any() else ''
+                    if col in date_columns and DOTTED_DATE_RE.match(first):
+                        # Dotted dates (HWiNFO's 7.5.2025) are day-first
+                        df[col] = pd.to_datetime(df[col], format='%d.%m.%Y', errors='coerce', cache=True)
+                    else:
+                        df[col] = pd.to_datetime(df[col], format='mixed', errors='coerce', cache=True)
                 except:
                     continue
             
             # Clean numeric columns
-            for col in self.df.columns:
+            for col in df.columns:
                 if 'temperature' in col.lower() or 'temp' in col.lower() or 'usage' in col.lower():
+                    if pd.api.types.is_numeric_dtype(df[col]):
+                        continue
                     try:
-                        # Remove any non-numeric characters except decimal point
-                        self.df[col] = self.df[col].astype(str).str.replace(r'[^\d.-]', '', regex=True)
-                        # Convert to numeric, invalid values become NaN
-                        self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+                        # Convert to numeric directly, invalid values become NaN
+                        numeric = pd.to_numeric(df[col], errors='coerce')
+                        # Values with units attached (e.g. "45 °C") need the number extracted
+                        if numeric.isna().mean() > NUMERIC_NAN_THRESHOLD:
+                            numeric = (df[col].astype('string')
+                                       .str.extract(NUMBER_RE, expand=False)
+                                       .astype('float32'))
+                        # Arrow keeps coerced NaN distinct from missing values, so move to NumPy where stats skip it
+                        if isinstance(numeric.dtype, pd.ArrowDtype):
+                            numeric = numeric.astype('float64')
+                        df[col] = pd.to_numeric(numeric, downcast='float')
                     except:
                         continue
             
             # Remove rows where all numeric columns are NaN
-            numeric_cols = self.df.select_dtypes(include=[np.number]).columns
-            if len(numeric_cols) > 0:
-                self.df = self.df.dropna(subset=numeric_cols, how='all')
+            all_numeric_cols = df.select_dtypes(include=[np.number]).columns
+            if len(all_numeric_cols) > 0:
+                df = df.loc[df[all_numeric_cols].notna().any(axis=1)]
+            
+            # Time-only values get a placeholder date, so anchor them to the logged date
+            time_col = self.time_column(df)
+            if time_col and 'Date' in df.columns and pd.api.types.is_datetime64_any_dtype(df['Date']):
+                times = df[time_col]
+                df[time_col] = df['Date'] + (times - times.dt.normalize())
             
         except Exception as e:
             print(f"Warning: Error during data cleaning: {str(e)}")
             # Continue with the data as is if cleaning fails
             
+        return df
+        
+    def clean_dataframe(self, df):
+        """Finish preparing the combined cleaned chunks for analysis and return the dataframe"""
+        try:
+            # Remove any completely empty rows and columns in a single slice
+            present = df.notna()
+            df = df.loc[present.any(axis=1), present.any(axis=0)]
+            
+            # Downcast cleaned columns: whole-number usage percentages to int8, the rest to float32
+            for col in df.columns:
+                if 'temperature' in col.lower() or 'temp' in col.lower() or 'usage' in col.lower():
+                    try:
+                        values = df[col]
+                        if 'usage' in col.lower() and values.min() >= 0 and values.max() <= 100:
+                            values = pd.to_numeric(values, downcast='integer')
+                        if pd.api.types.is_float_dtype(values):
+                            values = pd.to_numeric(values, downcast='float')
+                        df[col] = values
+                    except:
+                        continue
+            
+            # Index by the parsed time column so time ranges can be selected with between_time
+            time_col = self.time_column(df)
+            if time_col:
+                df = df.dropna(subset=[time_col]).set_index(time_col).sort_index()
+            
+        except Exception as e:
+            print(f"Warning: Error during data cleaning: {str(e)}")
+            # Continue with the data as is if cleaning fails
+            
+        return df
+        
+    def classify_columns(self):
+        """Cache the temperature, CPU usage, GPU usage and time column names"""
+        self._temp_cols, self._cpu_cols, self._gpu_cols = [], [], []
+        for col in self.df.columns:
+            # Only numeric columns can be plotted or summarized
+            if not pd.api.types.is_numeric_dtype(self.df[col]):
+                continue
+            name = col.lower()
+            if 'temp' in name:
+                self._temp_cols.append(col)
+            if 'cpu' in name and 'usage' in name:
+                self._cpu_cols.append(col)
+            if 'gpu' in name and 'usage' in name:
+                self._gpu_cols.append(col)
+        
+        # Only a parsed time index can drive the time range filter
+        self._time_col = self.df.index.name if isinstance(self.df.index, pd.DatetimeIndex) else None
+            
     def analyze_data(self):
         if self.df is None:
             messagebox.showwarning("Warning", "Please load a CSV file first!")
             return
             
         try:
-            # Clear previous graph
-            self.fig.clear()
-            
             # Get selected options
             graph_type = self.graph_type.get()
             time_range = self.time_range.get()
+            range_key = time_range
+            if time_range == "Custom Range":
+                range_key = (time_range, self.start_date.get_date().isoformat(), self.end_date.get_date().isoformat())
+                
+            # Filter, summarize and downsample on the worker thread; only drawing stays on Tk.
+            # The dataframe, its column classification and its stats cache are captured
+            # together, since a load that finishes meanwhile replaces all of them
+            self.root.config(cursor="watch")
+            df = self.df
+            columns = (self._time_col, self._temp_cols, self._cpu_cols, self._gpu_cols)
+            future = self._executor.submit(self._compute_analysis, df, columns, self._stats_cache, graph_type,
+                                           range_key, self.plot_point_budget(self.fig))
+            future.add_done_callback(lambda f: self.root.after(0, self._on_analyzed, df, graph_type, range_key, f))
+            
+        except Exception as e:
+            self.root.config(cursor="")
+            messagebox.showerror("Error", f"Error during analysis: {str(e)}")
             
-            # Filter data based on time range
-            if 'Time' in self.df.columns:
-                self.df['Time'] = pd.to_datetime(self.df['Time'])
-                if time_range != "All":
-                    if time_range == "Morning (6AM-12PM)":
-                        mask = (self.df['Time'].dt.hour >= 6) & (self.df['Time'].dt.hour < 12)
-                    elif time_range == "Afternoon (12PM-6PM)":
-                        mask = (self.df['Time'].dt.hour >= 12) & (self.df['Time'].dt.hour < 18)
-                    elif time_range == "Evening (6PM-12AM)":
-                        mask = (self.df['Time'].dt.hour >= 18) & (self.df['Time'].dt.hour < 24)
-                    else:  # Night
-                        mask = (self.df['Time'].dt.hour >= 0) & (self.df['Time'].dt.hour < 6)
-                    filtered_df = self.df[mask]
-                else:
-                    filtered_df = self.df
+    def _compute_analysis(self, df, columns, stats_cache, graph_type, range_key, n_out):
+        """Filter a dataframe to a time range off the Tk thread, returning plot data and summary stats"""
+        time_col, temp_cols, cpu_cols, gpu_cols = columns
+        
+        # Filter data based on time range (the time index was set and sorted at load)
+        if time_col and isinstance(range_key, tuple):
+            # Slicing the sorted index by day strings keeps whole days, end date included
+            _, start, end = range_key
+            filtered_df = df.loc[start:end]
+        elif time_col and range_key != "All":
+            start, end = TIME_RANGES[range_key]
+            filtered_df = df.between_time(start, end, inclusive='left')
+        else:
+            filtered_df = df
+            
+        # Mean/min/max of every metric column, computed once per time range
+        cols = list(dict.fromkeys(temp_cols + cpu_cols + gpu_cols))
+        summary = stats_cache.get(range_key)
+        if summary is None:
+            if cols:
+                summary = filtered_df[cols].agg(['mean', 'min', 'max'])
             else:
-                filtered_df = self.df
-                
-            # Create subplot
-            ax = self.fig.add_subplot(111)
+                # agg has nothing to reduce in a log without recognised metric columns
+                summary = pd.DataFrame(index=['mean', 'min', 'max'])
+            stats_cache[range_key] = summary
             
-            # Plot based on graph type
-            if graph_type == "Temperature":
-                self.plot_temperatures(filtered_df, ax)
-            elif graph_type == "CPU Usage":
-                self.plot_cpu_usage(filtered_df, ax)
-            elif graph_type == "GPU Usage":
-                self.plot_gpu_usage(filtered_df, ax)
-            else:  # All Metrics
-                self.plot_all_metrics(filtered_df)
+        if graph_type in CORRELATION_GRAPHS:
+            # Pairwise correlation of the metric columns; pandas fills one triangle and mirrors it
+            corr_key = ("Correlation", range_key)
+            corr = stats_cache.get(corr_key)
+            if corr is None:
+                corr = filtered_df[cols].corr()
+                # Empty and constant columns have no correlation with anything
+                keep = corr.notna().any()
+                corr = stats_cache[corr_key] = corr.loc[keep, keep]
+            return corr, summary
+            
+        # Downsample the plotted columns to roughly what the axis can show
+        plotted_cols = {"Temperature": temp_cols, "CPU Usage": cpu_cols, "GPU Usage": gpu_cols}.get(graph_type, cols)
+        points = {col: self.series_points(filtered_df, col, n_out) for col in plotted_cols}
+        return points, summary
+        
+    def _on_analyzed(self, df, graph_type, range_key, future):
+        """Draw the results of _compute_analysis, back on the Tk thread"""
+        self.root.config(cursor="")
+        if df is not self.df:
+            # Another file finished loading meanwhile; these results describe the old one
+            return
+        try:
+            points, summary = future.result()
+            
+            if graph_type == self._plotted_type and graph_type not in CORRELATION_GRAPHS:
+                # Same graph as before, so only the line data changes
+                self.update_lines(points)
+            else:
+                # Clear previous graph
+                self.fig.clear()
+                self._lines = []
+                
+                # Plot based on graph type
+                if graph_type == "Temperature":
+                    self.plot_temperatures(points, self.fig.add_subplot(111))
+                elif graph_type == "CPU Usage":
+                    self.plot_cpu_usage(points, self.fig.add_subplot(111))
+                elif graph_type == "GPU Usage":
+                    self.plot_gpu_usage(points, self.fig.add_subplot(111))
+                elif graph_type in CORRELATION_GRAPHS:
+                    self.plot_correlation(points, self.fig.add_subplot(111))
+                else:  # All Metrics
+                    self.plot_all_metrics(points)
+                    
+                # Rotate time labels and fit the layout once for the whole figure
+                if graph_type not in CORRELATION_GRAPHS:
+                    self.fig.autofmt_xdate(rotation=45, ha='right')
+                self.fig.tight_layout()
+                self._plotted_type = graph_type
                 
-            # Update canvas
-            self.canvas.draw()
+            # Start the toolbar's Home/Back history from the new view
+            self.toolbar.update()
             
-            # Generate analysis text
-            self.generate_analysis_text(filtered_df, graph_type)
+            # Update canvas once Tk is idle; repeated requests coalesce into one draw
+            self.canvas.draw_idle()
+            
+            # Rewrite the analysis text only when the graph type or time range changed
+            if (graph_type, range_key) != self._analysis_key:
+                self.generate_analysis_text(summary, graph_type)
+                self._analysis_key = (graph_type, range_key)
             
         except Exception as e:
+            self._plotted_type = None
             messagebox.showerror("Error", f"Error during analysis: {str(e)}")
             
     def zoom_in(self):
@@ -574,7 +811,7 @@ class GamingAnalyzerGUI:
             for ax in self.fig.axes:
                 ax.set_xlim(ax.get_xlim()[0] * 0.8, ax.get_xlim()[1] * 0.8)
                 ax.set_ylim(ax.get_ylim()[0] * 0.8, ax.get_ylim()[1] * 0.8)
-            self.canvas.draw()
+            self.canvas.draw_idle()
         except Exception as e:
             messagebox.showerror("Error", f"Error zooming in: {str(e)}")
             
@@ -584,29 +821,52 @@ class GamingAnalyzerGUI:
             for ax in self.fig.axes:
                 ax.set_xlim(ax.get_xlim()[0] * 1.2, ax.get_xlim()[1] * 1.2)
                 ax.set_ylim(ax.get_ylim()[0] * 1.2, ax.get_ylim()[1] * 1.2)
-            self.canvas.draw()
+            self.canvas.draw_idle()
         except Exception as e:
             messagebox.showerror("Error", f"Error zooming out: {str(e)}")
             
     def reset_view(self):
         """Reset the graph view to default"""
         try:
-            self.analyze_data()  # This will redraw the graph with default settings
+            if self._plotted_type is None:
+                self.analyze_data()
+                return
+            # Fit the axes back to the plotted data without recomputing it
+            for ax in self.fig.axes:
+                ax.relim()
+                ax.autoscale()
+            self.canvas.draw_idle()
         except Exception as e:
             messagebox.showerror("Error", f"Error resetting view: {str(e)}")
             
-    def plot_temperatures(self, df, ax):
-        # Find temperature columns
-        temp_cols = [col for col in df.columns if 'temperature' in col.lower() or 'temp' in col.lower()]
+    def plot_point_budget(self, fig):
+        """Number of points worth drawing per series at a figure's current width"""
+        return max(2 * int(fig.get_figwidth() * fig.dpi), MIN_PLOT_POINTS)
+        
+    def series_points(self, df, col, n_out):
+        """Downsampled x and y values of one column for plotting"""
+        return _downsample(df.index.to_numpy(), df[col].to_numpy(dtype='float64', na_value=np.nan), n_out)
+        
+    def update_lines(self, points):
+        """Point the existing plot lines at new data and rescale their axes"""
+        for col, line in self._lines:
+            line.set_data(*points[col])
+        for ax in self.fig.axes:
+            # Zooming or panning turns autoscaling off, which would keep the old view
+            ax.set_autoscale_on(True)
+            ax.relim()
+            ax.autoscale_view()
+            
+    def plot_temperatures(self, points, ax):
+        # Use the columns classified at load time
+        temp_cols = self._temp_cols
         
         # Use different colors for each line
         colors = [TOKYO_NIGHT['graph_line'], TOKYO_NIGHT['secondary'], TOKYO_NIGHT['success']]
         
         for i, col in enumerate(temp_cols):
-            if 'time' in df.columns:
-                ax.plot(df['Time'], df[col], label=col, color=colors[i % len(colors)])
-            else:
-                ax.plot(df.index, df[col], label=col, color=colors[i % len(colors)])
+            line, = ax.plot(*points[col], label=col, color=colors[i % len(colors)])
+            self._lines.append((col, line))
                 
         ax.set_title("Temperature Analysis", color=TOKYO_NIGHT['graph_text'])
         ax.set_xlabel("Time", color=TOKYO_NIGHT['graph_text'])
@@ -614,24 +874,16 @@ class GamingAnalyzerGUI:
         ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         ax.grid(True, alpha=0.3)
         
-        # Rotate x-axis labels for better readability
-        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
-        
-        # Adjust layout to prevent label cutoff
-        self.fig.tight_layout()
-        
-    def plot_cpu_usage(self, df, ax):
-        # Find CPU usage columns
-        cpu_cols = [col for col in df.columns if 'cpu' in col.lower() and 'usage' in col.lower()]
+    def plot_cpu_usage(self, points, ax):
+        # Use the columns classified at load time
+        cpu_cols = self._cpu_cols
         
         # Use different colors for each line
         colors = [TOKYO_NIGHT['graph_line'], TOKYO_NIGHT['secondary'], TOKYO_NIGHT['success']]
         
         for i, col in enumerate(cpu_cols):
-            if 'time' in df.columns:
-                ax.plot(df['Time'], df[col], label=col, color=colors[i % len(colors)])
-            else:
-                ax.plot(df.index, df[col], label=col, color=colors[i % len(colors)])
+            line, = ax.plot(*points[col], label=col, color=colors[i % len(colors)])
+            self._lines.append((col, line))
                 
         ax.set_title("CPU Usage Analysis", color=TOKYO_NIGHT['graph_text'])
         ax.set_xlabel("Time", color=TOKYO_NIGHT['graph_text'])
@@ -639,24 +891,16 @@ class GamingAnalyzerGUI:
         ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         ax.grid(True, alpha=0.3)
         
-        # Rotate x-axis labels for better readability
-        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
-        
-        # Adjust layout to prevent label cutoff
-        self.fig.tight_layout()
-        
-    def plot_gpu_usage(self, df, ax):
-        # Find GPU usage columns
-        gpu_cols = [col for col in df.columns if 'gpu' in col.lower() and 'usage' in col.lower()]
+    def plot_gpu_usage(self, points, ax):
+        # Use the columns classified at load time
+        gpu_cols = self._gpu_cols
         
         # Use different colors for each line
         colors = [TOKYO_NIGHT['graph_line'], TOKYO_NIGHT['secondary'], TOKYO_NIGHT['success']]
         
         for i, col in enumerate(gpu_cols):
-            if 'time' in df.columns:
-                ax.plot(df['Time'], df[col], label=col, color=colors[i % len(colors)])
-            else:
-                ax.plot(df.index, df[col], label=col, color=colors[i % len(colors)])
+            line, = ax.plot(*points[col], label=col, color=colors[i % len(colors)])
+            self._lines.append((col, line))
                 
         ax.set_title("GPU Usage Analysis", color=TOKYO_NIGHT['graph_text'])
         ax.set_xlabel("Time", color=TOKYO_NIGHT['graph_text'])
@@ -664,100 +908,73 @@ class GamingAnalyzerGUI:
         ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
         ax.grid(True, alpha=0.3)
         
-        # Rotate x-axis labels for better readability
-        plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
-        
-        # Adjust layout to prevent label cutoff
-        self.fig.tight_layout()
-        
-    def plot_all_metrics(self, df):
-        # Create subplots for different metrics
-        gs = self.fig.add_gridspec(3, 1, height_ratios=[1, 1, 1])
-        
-        # Temperature subplot
-        ax1 = self.fig.add_subplot(gs[0])
-        self.plot_temperatures(df, ax1)
-        
-        # CPU usage subplot
-        ax2 = self.fig.add_subplot(gs[1])
-        self.plot_cpu_usage(df, ax2)
-        
-        # GPU usage subplot
-        ax3 = self.fig.add_subplot(gs[2])
-        self.plot_gpu_usage(df, ax3)
-        
-        # Adjust layout to prevent overlap
-        self.fig.tight_layout()
-        
-    def generate_analysis_text(self, df, graph_type):
-        self.text_widget.delete(1.0, tk.END)
+    def plot_all_metrics(self, points):
+        # Stack the metrics in subplots sharing one time axis
+        ax1, ax2, ax3 = self.fig.subplots(3, 1, sharex=True)
+        self.plot_temperatures(points, ax1)
+        self.plot_cpu_usage(points, ax2)
+        self.plot_gpu_usage(points, ax3)
+        
+    def plot_correlation(self, corr, ax):
+        # Draw the matrix as one image rather than a patch per cell
+        image = ax.imshow(corr.to_numpy(), cmap='coolwarm', vmin=-1, vmax=1, aspect='auto')
+        self.fig.colorbar(image, ax=ax)
+        
+        ax.set_xticks(range(len(corr.columns)), corr.columns, rotation=45, ha='right', fontsize=7)
+        ax.set_yticks(range(len(corr.index)), corr.index, fontsize=7)
+        ax.set_title("Metric Correlation", color=TOKYO_NIGHT['graph_text'])
+        ax.grid(False)
+        
+    def generate_analysis_text(self, summary, graph_type):
+        # Assemble the whole report first so the text widget is updated in one insert
+        lines = []
+        
+        def add_stats(cols, unit):
+            for col in cols:
+                stats = summary[col]
+                lines.append(f"\n{col}:\n")
+                lines.append(f"Average: {stats['mean']:.2f}{unit}\n")
+                lines.append(f"Maximum: {stats['max']:.2f}{unit}\n")
+                lines.append(f"Minimum: {stats['min']:.2f}{unit}\n")
         
         # Basic statistics
-        self.text_widget.insert(tk.END, f"Analysis Results for {graph_type}\n")
-        self.text_widget.insert(tk.END, "=" * 50 + "\n\n")
+        lines.append(f"Analysis Results for {graph_type}\n")
+        lines.append("=" * 50 + "\n\n")
         
         if graph_type == "Temperature":
-            temp_cols = [col for col in df.columns if 'temperature' in col.lower() or 'temp' in col.lower()]
-            for col in temp_cols:
-                stats = df[col].describe()
-                self.text_widget.insert(tk.END, f"\n{col}:\n")
-                self.text_widget.insert(tk.END, f"Average: {stats['mean']:.2f}°C\n")
-                self.text_widget.insert(tk.END, f"Maximum: {stats['max']:.2f}°C\n")
-                self.text_widget.insert(tk.END, f"Minimum: {stats['min']:.2f}°C\n")
+            add_stats(self._temp_cols, "°C")
                 
         elif graph_type == "CPU Usage":
-            cpu_cols = [col for col in df.columns if 'cpu' in col.lower() and 'usage' in col.lower()]
-            for col in cpu_cols:
-                stats = df[col].describe()
-                self.text_widget.insert(tk.END, f"\n{col}:\n")
-                self.text_widget.insert(tk.END, f"Average: {stats['mean']:.2f}%\n")
-                self.text_widget.insert(tk.END, f"Maximum: {stats['max']:.2f}%\n")
-                self.text_widget.insert(tk.END, f"Minimum: {stats['min']:.2f}%\n")
+            add_stats(self._cpu_cols, "%")
                 
         elif graph_type == "GPU Usage":
-            gpu_cols = [col for col in df.columns if 'gpu' in col.lower() and 'usage' in col.lower()]
-            for col in gpu_cols:
-                stats = df[col].describe()
-                self.text_widget.insert(tk.END, f"\n{col}:\n")
-                self.text_widget.insert(tk.END, f"Average: {stats['mean']:.2f}%\n")
-                self.text_widget.insert(tk.END, f"Maximum: {stats['max']:.2f}%\n")
-                self.text_widget.insert(tk.END, f"Minimum: {stats['min']:.2f}%\n")
+            add_stats(self._gpu_cols, "%")
                 
         else:  # All Metrics
-            self.text_widget.insert(tk.END, "Comprehensive System Analysis:\n\n")
+            lines.append("Comprehensive System Analysis:\n\n")
             
             # Temperature analysis
-            temp_cols = [col for col in df.columns if 'temperature' in col.lower() or 'temp' in col.lower()]
-            if temp_cols:
-                self.text_widget.insert(tk.END, "Temperature Analysis:\n")
-                for col in temp_cols:
-                    stats = df[col].describe()
-                    self.text_widget.insert(tk.END, f"\n{col}:\n")
-                    self.text_widget.insert(tk.END, f"Average: {stats['mean']:.2f}°C\n")
-                    self.text_widget.insert(tk.END, f"Maximum: {stats['max']:.2f}°C\n")
-                    self.text_widget.insert(tk.END, f"Minimum: {stats['min']:.2f}°C\n")
+            if self._temp_cols:
+                lines.append("Temperature Analysis:\n")
+                add_stats(self._temp_cols, "°C")
                     
             # CPU analysis
-            cpu_cols = [col for col in df.columns if 'cpu' in col.lower() and 'usage' in col.lower()]
-            if cpu_cols:
-                self.text_widget.insert(tk.END, "\nCPU Usage Analysis:\n")
-                for col in cpu_cols:
-                    stats = df[col].describe()
-                    self.text_widget.insert(tk.END, f"\n{col}:\n")
-                    self.text_widget.insert(tk.END, f"Average: {stats['mean']:.2f}%\n")
-                    self.text_widget.insert(tk.END, f"Maximum: {stats['max']:.2f}%\n")
-                    self.text_widget.insert(tk.END, f"Minimum: {stats['min']:.2f}%\n")
+            if self._cpu_cols:
+                lines.append("\nCPU Usage Analysis:\n")
+                add_stats(self._cpu_cols, "%")
                     
             # GPU analysis
-            gpu_cols = [col for col in df.columns if 'gpu' in col.lower() and 'usage' in col.lower()]
-            if gpu_cols:
-                self.text_widget.insert(tk.END, "\nGPU Usage Analysis:\n")
-                for col in gpu_cols:
-                    stats = df[col].describe()
-                    self.text_widget.insert(tk.END, f"\n{col}:\n")
-                    self.text_widget.insert(tk.END, f"Average: {stats['mean']:.2f}%\n")
-                    self.text_widget.insert(tk.END, f"Maximum: {stats['max']:.2f}%\n")
-                    self.text_widget.insert(tk.END, f"Minimum: {stats['min']:.2f}%\n")
+            if self._gpu_cols:
+                lines.append("\nGPU Usage Analysis:\n")
+                add_stats(self._gpu_cols, "%")
+        
+        # Keep the report so copy and export don't have to read it back out of Tk
+        self.analysis_text = "".join(lines)
+        
+        self.text_widget.config(state=tk.NORMAL)
+        self.text_widget.delete(1.0, tk.END)
+        self.text_widget.insert(tk.END, self.analysis_text)
+        self.text_widget.config(state=tk.DISABLED)
                     
     def save_graph(self):
         if not hasattr(self, 'fig'):
@@ -766,20 +983,25 @@ class GamingAnalyzerGUI:
             
         file_path = filedialog.asksaveasfilename(
             defaultextension=".png",
-            filetypes=[("PNG files", "*.png"), ("All files", "*.*")]
+            filetypes=[("PNG files", "*.png"), ("JPEG files", "*.jpg"), ("All files", "*.*")]
         )
         
         if file_path:
             try:
-                self.fig.savefig(file_path, dpi=300, bbox_inches='tight')
+                # 150 dpi is plenty for line charts; light PNG compression keeps saves quick.
+                # Only the Pillow-backed formats accept pil_kwargs, so PDF/SVG saves go without
+                save_kwargs = {'dpi': 150, 'bbox_inches': 'tight', 'facecolor': self.fig.get_facecolor()}
+                if file_path.lower().endswith('.png'):
+                    save_kwargs['pil_kwargs'] = {'compress_level': self.png_compress_level}
+                self.fig.savefig(file_path, **save_kwargs)
                 messagebox.showinfo("Success", "Graph saved successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Error saving graph: {str(e)}")
                 
     def copy_analysis(self):
-        if self.text_widget.get(1.0, tk.END).strip():
+        if self.analysis_text:
             self.root.clipboard_clear()
-            self.root.clipboard_append(self.text_widget.get(1.0, tk.END))
+            self.root.clipboard_append(self.analysis_text)
             messagebox.showinfo("Success", "Analysis copied to clipboard!")
         else:
             messagebox.showwarning("Warning", "No analysis to copy!")
@@ -790,72 +1012,85 @@ class GamingAnalyzerGUI:
             messagebox.showwarning("Warning", "Please load data first!")
             return
             
+        # The report only depends on the loaded file, so build it once per load
+        analysis_text = self._report_cache.get("statistics")
+        if analysis_text is None:
+            analysis_text = self._report_cache["statistics"] = self.statistics_report()
+            
         # Create new window for statistical analysis
         stats_window = tk.Toplevel(self.root)
         stats_window.title("Statistical Analysis")
         stats_window.geometry("600x400")
         
-        # Create text widget for analysis
+        # Create text widget for analysis, filling it before it is packed so
+        # Tk lays out the whole report once when the window appears
         text_widget = tk.Text(stats_window, wrap=tk.WORD, padx=10, pady=10)
+        text_widget.insert(tk.END, analysis_text)
+        text_widget.config(state=tk.DISABLED)
         text_widget.pack(fill=tk.BOTH, expand=True)
         
-        # Perform statistical analysis
-        analysis_text = "Statistical Analysis Report\n"
-        analysis_text += "=" * 30 + "\n\n"
+    def statistics_report(self):
+        """Build the statistical analysis report text for the loaded data"""
+        # Perform statistical analysis, collecting the report in pieces joined once at the end
+        lines = ["Statistical Analysis Report\n", "=" * 30 + "\n\n"]
+        
+        # Use the columns classified at load time
+        temp_cols, cpu_cols, gpu_cols = self._temp_cols, self._cpu_cols, self._gpu_cols
+        
+        # Describe every column in one pass, then read each column's figures from the result;
+        # describe() refuses a frame without columns, and then no section reads it anyway
+        report_cols = list(dict.fromkeys(temp_cols + cpu_cols + gpu_cols))
+        all_stats = self.df[report_cols].describe() if report_cols else None
         
         # Temperature analysis
-        temp_cols = [col for col in self.df.columns if 'temperature' in col.lower() or 'temp' in col.lower()]
         if temp_cols:
-            analysis_text += "Temperature Analysis:\n"
+            lines.append("Temperature Analysis:\n")
             for col in temp_cols:
-                stats_data = self.df[col].describe()
-                analysis_text += f"\n{col}:\n"
-                analysis_text += f"Mean: {stats_data['mean']:.2f}°C\n"
-                analysis_text += f"Std Dev: {stats_data['std']:.2f}°C\n"
-                analysis_text += f"Min: {stats_data['min']:.2f}°C\n"
-                analysis_text += f"Max: {stats_data['max']:.2f}°C\n"
-                analysis_text += f"25th percentile: {stats_data['25%']:.2f}°C\n"
-                analysis_text += f"75th percentile: {stats_data['75%']:.2f}°C\n"
+                stats_data = all_stats[col]
+                lines.append(f"\n{col}:\n")
+                lines.append(f"Mean: {stats_data['mean']:.2f}°C\n")
+                lines.append(f"Std Dev: {stats_data['std']:.2f}°C\n")
+                lines.append(f"Min: {stats_data['min']:.2f}°C\n")
+                lines.append(f"Max: {stats_data['max']:.2f}°C\n")
+                lines.append(f"25th percentile: {stats_data['25%']:.2f}°C\n")
+                lines.append(f"75th percentile: {stats_data['75%']:.2f}°C\n")
         
         # CPU Usage analysis
-        cpu_cols = [col for col in self.df.columns if 'cpu' in col.lower() and 'usage' in col.lower()]
         if cpu_cols:
-            analysis_text += "\nCPU Usage Analysis:\n"
+            lines.append("\nCPU Usage Analysis:\n")
             for col in cpu_cols:
-                stats_data = self.df[col].describe()
-                analysis_text += f"\n{col}:\n"
-                analysis_text += f"Mean: {stats_data['mean']:.2f}%\n"
-                analysis_text += f"Std Dev: {stats_data['std']:.2f}%\n"
-                analysis_text += f"Min: {stats_data['min']:.2f}%\n"
-                analysis_text += f"Max: {stats_data['max']:.2f}%\n"
+                stats_data = all_stats[col]
+                lines.append(f"\n{col}:\n")
+                lines.append(f"Mean: {stats_data['mean']:.2f}%\n")
+                lines.append(f"Std Dev: {stats_data['std']:.2f}%\n")
+                lines.append(f"Min: {stats_data['min']:.2f}%\n")
+                lines.append(f"Max: {stats_data['max']:.2f}%\n")
         
         # GPU Usage analysis
-        gpu_cols = [col for col in self.df.columns if 'gpu' in col.lower() and 'usage' in col.lower()]
         if gpu_cols:
-            analysis_text += "\nGPU Usage Analysis:\n"
+            lines.append("\nGPU Usage Analysis:\n")
             for col in gpu_cols:
-                stats_data = self.df[col].describe()
-                analysis_text += f"\n{col}:\n"
-                analysis_text += f"Mean: {stats_data['mean']:.2f}%\n"
-                analysis_text += f"Std Dev: {stats_data['std']:.2f}%\n"
-                analysis_text += f"Min: {stats_data['min']:.2f}%\n"
-                analysis_text += f"Max: {stats_data['max']:.2f}%\n"
+                stats_data = all_stats[col]
+                lines.append(f"\n{col}:\n")
+                lines.append(f"Mean: {stats_data['mean']:.2f}%\n")
+                lines.append(f"Std Dev: {stats_data['std']:.2f}%\n")
+                lines.append(f"Min: {stats_data['min']:.2f}%\n")
+                lines.append(f"Max: {stats_data['max']:.2f}%\n")
         
         # Correlation analysis
         if len(temp_cols) > 0 and (len(cpu_cols) > 0 or len(gpu_cols) > 0):
-            analysis_text += "\nCorrelation Analysis:\n"
+            lines.append("\nCorrelation Analysis:\n")
+            # One pairwise-complete correlation matrix instead of a Series.corr call per pair
+            corr = self.df[list(dict.fromkeys(temp_cols + cpu_cols + gpu_cols))].corr()
             for temp_col in temp_cols:
                 for cpu_col in cpu_cols:
-                    corr = self.df[temp_col].corr(self.df[cpu_col])
-                    analysis_text += f"\n{temp_col} vs {cpu_col}:\n"
-                    analysis_text += f"Correlation coefficient: {corr:.2f}\n"
+                    lines.append(f"\n{temp_col} vs {cpu_col}:\n")
+                    lines.append(f"Correlation coefficient: {corr.at[temp_col, cpu_col]:.2f}\n")
                 for gpu_col in gpu_cols:
-                    corr = self.df[temp_col].corr(self.df[gpu_col])
-                    analysis_text += f"\n{temp_col} vs {gpu_col}:\n"
-                    analysis_text += f"Correlation coefficient: {corr:.2f}\n"
+                    lines.append(f"\n{temp_col} vs {gpu_col}:\n")
+                    lines.append(f"Correlation coefficient: {corr.at[temp_col, gpu_col]:.2f}\n")
         
-        text_widget.insert(tk.END, analysis_text)
-        text_widget.config(state=tk.DISABLED)
+        return "".join(lines)
         
     def show_performance_trends(self):
         """Show performance trends analysis"""
@@ -863,15 +1098,28 @@ class GamingAnalyzerGUI:
             messagebox.showwarning("Warning", "Please load data first!")
             return
             
+        # The trends only depend on the loaded file, so the figure is built once per load
+        fig = self._report_cache.get("trends")
+        if fig is None:
+            fig = self._report_cache["trends"] = self.build_trends_figure()
+        elif isinstance(fig.canvas, FigureCanvasTkAgg) and fig.canvas.get_tk_widget().winfo_exists():
+            # Its window is still open, so bring that to the front instead
+            fig.canvas.get_tk_widget().winfo_toplevel().lift()
+            return
+            
         # Create new window for trends
         trends_window = tk.Toplevel(self.root)
         trends_window.title("Performance Trends")
         trends_window.geometry("800x600")
         
-        # Create figure for trends
-        fig = plt.Figure(figsize=(10, 8))
+        # Attach the figure to a canvas in the new window
         canvas = FigureCanvasTkAgg(fig, master=trends_window)
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas.draw()
+        
+    def build_trends_figure(self):
+        """Plot the temperature, CPU and GPU trends of the loaded data on a new figure"""
+        fig = plt.Figure(figsize=(10, 8))
         
         # Create subplots
         gs = fig.add_gridspec(3, 1)
@@ -879,34 +1127,28 @@ class GamingAnalyzerGUI:
         ax2 = fig.add_subplot(gs[1])
         ax3 = fig.add_subplot(gs[2])
         
-        # Plot trends
-        if 'Time' in self.df.columns:
-            time_data = self.df['Time']
-        else:
-            time_data = self.df.index
-            
+        # Plot trends, downsampled to roughly what the window can show
+        n_out = self.plot_point_budget(fig)
+        
         # Temperature trends
-        temp_cols = [col for col in self.df.columns if 'temperature' in col.lower() or 'temp' in col.lower()]
-        for col in temp_cols:
-            ax1.plot(time_data, self.df[col], label=col)
+        for col in self._temp_cols:
+            ax1.plot(*self.series_points(self.df, col, n_out), label=col)
         ax1.set_title("Temperature Trends")
         ax1.set_ylabel("Temperature (°C)")
         ax1.legend()
         ax1.grid(True)
         
         # CPU usage trends
-        cpu_cols = [col for col in self.df.columns if 'cpu' in col.lower() and 'usage' in col.lower()]
-        for col in cpu_cols:
-            ax2.plot(time_data, self.df[col], label=col)
+        for col in self._cpu_cols:
+            ax2.plot(*self.series_points(self.df, col, n_out), label=col)
         ax2.set_title("CPU Usage Trends")
         ax2.set_ylabel("Usage (%)")
         ax2.legend()
         ax2.grid(True)
         
         # GPU usage trends
-        gpu_cols = [col for col in self.df.columns if 'gpu' in col.lower() and 'usage' in col.lower()]
-        for col in gpu_cols:
-            ax3.plot(time_data, self.df[col], label=col)
+        for col in self._gpu_cols:
+            ax3.plot(*self.series_points(self.df, col, n_out), label=col)
         ax3.set_title("GPU Usage Trends")
         ax3.set_xlabel("Time")
         ax3.set_ylabel("Usage (%)")
@@ -914,7 +1156,7 @@ class GamingAnalyzerGUI:
         ax3.grid(True)
         
         fig.tight_layout()
-        canvas.draw()
+        return fig
         
     def detect_anomalies(self):
         """Detect anomalies in the data"""
@@ -922,57 +1164,77 @@ class GamingAnalyzerGUI:
             messagebox.showwarning("Warning", "Please load data first!")
             return
             
+        # The report only depends on the loaded file, so show it again without rescanning
+        anomalies_text = self._report_cache.get("anomalies")
+        if anomalies_text is not None:
+            self.show_anomaly_report(anomalies_text)
+            return
+            
+        # Scan for anomalies on the worker thread and show the report once it is ready.
+        # The dataframe, its column classification and its report cache are captured
+        # together, since a load that finishes meanwhile replaces all of them
+        self.root.config(cursor="watch")
+        report_cache = self._report_cache
+        future = self._executor.submit(self._find_anomalies, self.df,
+                                       (self._temp_cols, self._cpu_cols, self._gpu_cols))
+        future.add_done_callback(lambda f: self.root.after(0, self._on_anomalies_found, report_cache, f))
+        
+    def _find_anomalies(self, df, columns):
+        """Build the anomaly report text for a dataframe off the Tk thread"""
+        temp_cols, cpu_cols, gpu_cols = columns
+        
+        # Detect anomalies using the Z-score method over every metric column at once
+        lines = ["Anomaly Detection Report\n", "=" * 30 + "\n\n"]
+        
+        cols = list(dict.fromkeys(temp_cols + cpu_cols + gpu_cols))
+        values = df[cols].to_numpy(dtype=np.float32, na_value=np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            z_scores = np.abs(values - np.nanmean(values, axis=0)) / np.nanstd(values, axis=0)
+        # Values more than 3 standard deviations; NaN readings and constant columns never qualify
+        anomalous = z_scores > 3
+        positions = {col: i for i, col in enumerate(cols)}
+        
+        for title, group_cols, unit in (("Temperature Anomalies:\n", temp_cols, "°C"),
+                                        ("\nCPU Usage Anomalies:\n", cpu_cols, "%"),
+                                        ("\nGPU Usage Anomalies:\n", gpu_cols, "%")):
+            if not group_cols:
+                continue
+            lines.append(title)
+            for col in group_cols:
+                i = positions[col]
+                rows = np.flatnonzero(anomalous[:, i])
+                if rows.size:
+                    lines.append(f"\n{col}:\n")
+                    lines.extend(f"Time: {idx}, Value: {value:.2f}{unit}\n"
+                                 for idx, value in zip(df.index[rows], values[rows, i]))
+        
+        return "".join(lines)
+        
+    def _on_anomalies_found(self, report_cache, future):
+        """Show and cache the report from _find_anomalies, back on the Tk thread"""
+        self.root.config(cursor="")
+        try:
+            anomalies_text = report_cache["anomalies"] = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Error detecting anomalies: {str(e)}")
+            return
+        # Only show it if its file is still the loaded one
+        if report_cache is self._report_cache:
+            self.show_anomaly_report(anomalies_text)
+        
+    def show_anomaly_report(self, anomalies_text):
+        """Open a window showing an anomaly report"""
         # Create new window for anomalies
         anomalies_window = tk.Toplevel(self.root)
         anomalies_window.title("Anomaly Detection")
         anomalies_window.geometry("600x400")
         
-        # Create text widget for anomalies
+        # Create text widget for anomalies, filling it before it is packed so
+        # Tk lays out the whole report once when the window appears
         text_widget = tk.Text(anomalies_window, wrap=tk.WORD, padx=10, pady=10)
-        text_widget.pack(fill=tk.BOTH, expand=True)
-        
-        # Detect anomalies using Z-score method
-        anomalies_text = "Anomaly Detection Report\n"
-        anomalies_text += "=" * 30 + "\n\n"
-        
-        # Temperature anomalies
-        temp_cols = [col for col in self.df.columns if 'temperature' in col.lower() or 'temp' in col.lower()]
-        if temp_cols:
-            anomalies_text += "Temperature Anomalies:\n"
-            for col in temp_cols:
-                z_scores = np.abs(stats.zscore(self.df[col].dropna()))
-                anomalies = self.df[z_scores > 3]  # Values more than 3 standard deviations
-                if not anomalies.empty:
-                    anomalies_text += f"\n{col}:\n"
-                    for idx, row in anomalies.iterrows():
-                        anomalies_text += f"Time: {idx}, Value: {row[col]:.2f}°C\n"
-        
-        # CPU usage anomalies
-        cpu_cols = [col for col in self.df.columns if 'cpu' in col.lower() and 'usage' in col.lower()]
-        if cpu_cols:
-            anomalies_text += "\nCPU Usage Anomalies:\n"
-            for col in cpu_cols:
-                z_scores = np.abs(stats.zscore(self.df[col].dropna()))
-                anomalies = self.df[z_scores > 3]
-                if not anomalies.empty:
-                    anomalies_text += f"\n{col}:\n"
-                    for idx, row in anomalies.iterrows():
-                        anomalies_text += f"Time: {idx}, Value: {row[col]:.2f}%\n"
-        
-        # GPU usage anomalies
-        gpu_cols = [col for col in self.df.columns if 'gpu' in col.lower() and 'usage' in col.lower()]
-        if gpu_cols:
-            anomalies_text += "\nGPU Usage Anomalies:\n"
-            for col in gpu_cols:
-                z_scores = np.abs(stats.zscore(self.df[col].dropna()))
-                anomalies = self.df[z_scores > 3]
-                if not anomalies.empty:
-                    anomalies_text += f"\n{col}:\n"
-                    for idx, row in anomalies.iterrows():
-                        anomalies_text += f"Time: {idx}, Value: {row[col]:.2f}%\n"
-        
         text_widget.insert(tk.END, anomalies_text)
         text_widget.config(state=tk.DISABLED)
+        text_widget.pack(fill=tk.BOTH, expand=True)
         
     def configure_alerts(self):
         """Configure alert thresholds"""
@@ -1014,6 +1276,9 @@ class GamingAnalyzerGUI:
         if self.df is None:
             messagebox.showwarning("Warning", "Please load data first!")
             return
+        if not self.analysis_text:
+            messagebox.showwarning("Warning", "No analysis to export!")
+            return
             
         file_path = filedialog.asksaveasfilename(
             defaultextension=".txt",
@@ -1022,8 +1287,8 @@ class GamingAnalyzerGUI:
         
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    f.write(self.text_widget.get(1.0, tk.END))
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(self.analysis_text)
                 messagebox.showinfo("Success", "Analysis exported successfully!")
             except Exception as e:
                 messagebox.showerror("Error", f"Error exporting analysis: {str(e)}")
@@ -1033,7 +1298,7 @@ class GamingAnalyzerGUI:
         # Create new window for graph settings
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Graph Settings")
-        settings_window.geometry("300x200")
+        settings_window.geometry("300x240")
         
         # Create settings options
         ttk.Label(settings_window, text="Graph Style:").grid(row=0, column=0, padx=5, pady=5)
@@ -1049,6 +1314,11 @@ class GamingAnalyzerGUI:
         legend_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(settings_window, variable=legend_var).grid(row=2, column=1)
         
+        ttk.Label(settings_window, text="PNG Compression:").grid(row=3, column=0, padx=5, pady=5)
+        compress_var = tk.IntVar(value=self.png_compress_level)
+        ttk.Spinbox(settings_window, from_=0, to=9, width=5, textvariable=compress_var,
+                    state="readonly").grid(row=3, column=1, columnspan=2, sticky=tk.W)
+        
         def apply_settings():
             # Update graph settings
             plt.style.use('dark_background')
@@ -1056,11 +1326,13 @@ class GamingAnalyzerGUI:
                 'axes.grid': grid_var.get(),
                 'legend.frameon': legend_var.get()
             })
-            # Redraw current graph
+            self.png_compress_level = compress_var.get()
+            # Redraw current graph from scratch so new artists pick up the style
+            self._plotted_type = None
             self.analyze_data()
             settings_window.destroy()
             
-        ttk.Button(settings_window, text="Apply", command=apply_settings).grid(row=3, column=0, columnspan=3, pady=10)
+        ttk.Button(settings_window, text="Apply", command=apply_settings).grid(row=4, column=0, columnspan=3, pady=10)
 
 if __name__ == "__main__":
     root = tk.Tk()
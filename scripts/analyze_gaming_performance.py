@@ -1,85 +1,64 @@
 import pandas as pd
 import glob
 import os
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
+import numpy as np
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 # Set style for better looking plots
 plt.style.use('default')
 sns.set_theme(style="darkgrid")
 
-def parse_datetime(date_str, time_str):
-    try:
-        # Try to parse the date and time
-        date_time_str = f"{date_str} {time_str}"
-        return pd.to_datetime(date_time_str, format='%d.%m.%Y %H:%M:%S.%f')
-    except:
-        return None
-
-# Read the CSV files
-data_folder = 'Data'
-csv_files = glob.glob(os.path.join(data_folder, '*.csv'))
+def read_log(file, encoding):
+    """Read a log with Arrow's multithreaded CSV parser when available"""
+    if not HAS_PYARROW:
+        return pd.read_csv(file, encoding=encoding, on_bad_lines='skip')
+    df = pd.read_csv(file, encoding=encoding, on_bad_lines='skip', engine='pyarrow')
+    # Arrow keeps repeated sensor names as-is; number them the way the C parser does
+    df.columns = pd.read_csv(file, encoding=encoding, nrows=0).columns
+    return df
 
-dataframes = []
-for file in csv_files:
+def load_log(file):
+    """Read one log and index it by time, or return None if it can't be read"""
     try:
         # Try different encodings and handle errors
-        df = pd.read_csv(file, encoding='utf-8', on_bad_lines='skip')
+        df = read_log(file, 'utf-8')
     except UnicodeDecodeError:
         try:
-            df = pd.read_csv(file, encoding='latin1', on_bad_lines='skip')
+            df = read_log(file, 'latin1')
         except Exception as e:
             print(f"Could not read file {file}: {str(e)}")
-            continue
+            return None
+    
+    # Readings arrive as text when a log ends with a repeated header row, so
+    # convert every column that holds numbers to float32, which is plenty for
+    # °C and % sensor values and halves the memory of float64
+    sensor_cols = df.columns.difference(['Date', 'Time'], sort=False)
+    numeric = df[sensor_cols].apply(pd.to_numeric, errors='coerce', downcast='float')
+    numeric = numeric.loc[:, numeric.notna().any()]
+    # Swap the converted columns in with one concat rather than one insert per column
+    df = pd.concat([df.drop(columns=numeric.columns), numeric], axis=1)[df.columns]
     
-    # Add a source column to track which file the data came from
-    df['Source'] = os.path.basename(file)
+    # Add a source column to track which file the data came from; as a
+    # categorical it stores one code per row instead of a repeated string
+    df['Source'] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), categories=[os.path.basename(file)])
     
     # Try to create a datetime index if possible
     if 'Date' in df.columns and 'Time' in df.columns:
-        df['DateTime'] = df.apply(lambda row: parse_datetime(row['Date'], row['Time']), axis=1)
+        # Parse every row in one vectorized pass; rows that don't match become NaT
+        combined = df['Date'].astype(str).str.cat(df['Time'].astype(str), sep=' ')
+        df['DateTime'] = pd.to_datetime(combined, format='%d.%m.%Y %H:%M:%S.%f', errors='coerce')
         df = df.set_index('DateTime')
     
-    dataframes.append(df)
-
-# Print information about each dataset
-for i, df in enumerate(dataframes):
-    print(f"\n📊 Dataset {i+1} from: {df['Source'].iloc[0]}")
-    print(f"📈 Number of rows: {len(df)}")
-    print(f"📋 Number of columns: {len(df.columns)}")
-    print("\n🔍 Key performance metrics available:")
-    
-    # Group metrics by category
-    metrics = {
-        'CPU': [],
-        'GPU': [],
-        'Memory': [],
-        'Temperature': [],
-        'Power': [],
-        'Other': []
-    }
-    
-    for col in df.columns:
-        col_lower = col.lower()
-        if 'cpu' in col_lower:
-            metrics['CPU'].append(col)
-        elif 'gpu' in col_lower:
-            metrics['GPU'].append(col)
-        elif 'memory' in col_lower:
-            metrics['Memory'].append(col)
-        elif 'temperature' in col_lower or 'temp' in col_lower:
-            metrics['Temperature'].append(col)
-        elif 'power' in col_lower or 'watt' in col_lower:
-            metrics['Power'].append(col)
-        elif any(term in col_lower for term in ['load', 'usage', 'fps', 'frequency']):
-            metrics['Other'].append(col)
-    
-    for category, cols in metrics.items():
-        if cols:
-            print(f"\n{category}:")
-            for col in cols:
-                print(f"  - {col}")
+    return df
 
 def plot_performance_metrics(df, title):
     """Plot CPU, GPU, and Memory usage over time"""
@@ -142,40 +121,97 @@ def plot_temperature_power(df, title):
     plt.tight_layout()
     plt.show()
 
-# Plot metrics for each dataset
-for df in dataframes:
-    title = df['Source'].iloc[0]
-    print(f"\n📈 Generating plots for: {title}")
-    
-    plot_performance_metrics(df, title)
-    plot_temperature_power(df, title)
-    
-    # Calculate and print some statistics
-    print("\n📊 Performance Statistics:")
-    
-    # CPU Statistics
-    cpu_cols = [col for col in df.columns if 'cpu' in col.lower() and 'usage' in col.lower()]
-    if cpu_cols:
-        for col in cpu_cols:
-            print(f"\n{col}:")
-            print(f"  Average: {df[col].mean():.2f}%")
-            print(f"  Max: {df[col].max():.2f}%")
-            print(f"  Min: {df[col].min():.2f}%")
-    
-    # GPU Statistics
-    gpu_cols = [col for col in df.columns if 'gpu' in col.lower() and 'usage' in col.lower()]
-    if gpu_cols:
-        for col in gpu_cols:
-            print(f"\n{col}:")
-            print(f"  Average: {df[col].mean():.2f}%")
-            print(f"  Max: {df[col].max():.2f}%")
-            print(f"  Min: {df[col].min():.2f}%")
-    
-    # Temperature Statistics
-    temp_cols = [col for col in df.columns if 'temperature' in col.lower() or 'temp' in col.lower()]
-    if temp_cols:
-        for col in temp_cols:
-            print(f"\n{col}:")
-            print(f"  Average: {df[col].mean():.2f}°C")
-            print(f"  Max: {df[col].max():.2f}°C")
-            print(f"  Min: {df[col].min():.2f}°C") 
\ No newline at end of file
+if __name__ == '__main__':
+    # Read the CSV files
+    data_folder = 'Data'
+    csv_files = glob.glob(os.path.join(data_folder, '*.csv'))
+
+    # Each file is parsed independently, so spread them over worker processes
+    if len(csv_files) > 1:
+        with ProcessPoolExecutor() as executor:
+            loaded = list(executor.map(load_log, csv_files))
+    else:
+        loaded = [load_log(file) for file in csv_files]
+    dataframes = [df for df in loaded if df is not None]
+
+    # Print information about each dataset
+    for i, df in enumerate(dataframes):
+        print(f"\n📊 Dataset {i+1} from: {df['Source'].iloc[0]}")
+        print(f"📈 Number of rows: {len(df)}")
+        print(f"📋 Number of columns: {len(df.columns)}")
+        print("\n🔍 Key performance metrics available:")
+        
+        # Group metrics by category
+        metrics = {
+            'CPU': [],
+            'GPU': [],
+            'Memory': [],
+            'Temperature': [],
+            'Power': [],
+            'Other': []
+        }
+        
+        for col in df.columns:
+            col_lower = col.lower()
+            if 'cpu' in col_lower:
+                metrics['CPU'].append(col)
+            elif 'gpu' in col_lower:
+                metrics['GPU'].append(col)
+            elif 'memory' in col_lower:
+                metrics['Memory'].append(col)
+            elif 'temperature' in col_lower or 'temp' in col_lower:
+                metrics['Temperature'].append(col)
+            elif 'power' in col_lower or 'watt' in col_lower:
+                metrics['Power'].append(col)
+            elif any(term in col_lower for term in ['load', 'usage', 'fps', 'frequency']):
+                metrics['Other'].append(col)
+        
+        for category, cols in metrics.items():
+            if cols:
+                print(f"\n{category}:")
+                for col in cols:
+                    print(f"  - {col}")
+
+    # Plot metrics for each dataset
+    for df in dataframes:
+        title = df['Source'].iloc[0]
+        print(f"\n📈 Generating plots for: {title}")
+        
+        plot_performance_metrics(df, title)
+        plot_temperature_power(df, title)
+        
+        # Calculate and print some statistics
+        print("\n📊 Performance Statistics:")
+        
+        cpu_cols = [col for col in df.columns if 'cpu' in col.lower() and 'usage' in col.lower()]
+        gpu_cols = [col for col in df.columns if 'gpu' in col.lower() and 'usage' in col.lower()]
+        temp_cols = [col for col in df.columns if 'temperature' in col.lower() or 'temp' in col.lower()]
+        
+        # Reduce every reported column in one pass, then read the figures per column;
+        # agg refuses an empty selection, and then no section below reads it anyway
+        stat_cols = list(dict.fromkeys(cpu_cols + gpu_cols + temp_cols))
+        stats = df[stat_cols].agg(['mean', 'max', 'min']) if stat_cols else None
+        
+        # CPU Statistics
+        if cpu_cols:
+            for col in cpu_cols:
+                print(f"\n{col}:")
+                print(f"  Average: {stats.at['mean', col]:.2f}%")
+                print(f"  Max: {stats.at['max', col]:.2f}%")
+                print(f"  Min: {stats.at['min', col]:.2f}%")
+        
+        # GPU Statistics
+        if gpu_cols:
+            for col in gpu_cols:
+                print(f"\n{col}:")
+                print(f"  Average: {stats.at['mean', col]:.2f}%")
+                print(f"  Max: {stats.at['max', col]:.2f}%")
+                print(f"  Min: {stats.at['min', col]:.2f}%")
+        
+        # Temperature Statistics
+        if temp_cols:
+            for col in temp_cols:
+                print(f"\n{col}:")
+                print(f"  Average: {stats.at['mean', col]:.2f}°C")
+                print(f"  Max: {stats.at['max', col]:.2f}°C")
+                print(f"  Min: {stats.at['min', col]:.2f}°C")
\ No newline at end of file
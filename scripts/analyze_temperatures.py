@@ -1,221 +1,240 @@
 import pandas as pd
 import glob
+import io
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+import matplotlib
+# Plots are saved to disk, so render off-screen
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import seaborn as sns
 from datetime import datetime
-import numpy as np
 import matplotlib.dates as mdates
 
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Set METRICMATE_DEBUG=1 to print memory usage of the cleaned data
+DEBUG = os.environ.get('METRICMATE_DEBUG') == '1'
+
+# Session logs are read in chunks of this many rows to bound peak memory
+CHUNK_SIZE = 200_000
+
+# Pattern for the first number in a sensor reading, compiled once
+NUM_RE = re.compile(r'([-+]?\d*\.?\d+)')
+
 # Set style for better looking plots
 plt.style.use('default')
 sns.set_theme(style="darkgrid")
 
-def parse_datetime(date_str, time_str):
-    """Parse datetime from various possible formats"""
-    try:
-        # Try the first format
-        date_time_str = f"{date_str} {time_str}"
-        return pd.to_datetime(date_time_str, format='%d.%m.%Y %H:%M:%S.%f')
-    except:
-        try:
-            # Try alternative format
-            return pd.to_datetime(date_time_str)
-        except:
-            try:
-                # Try parsing just the time if date is invalid
-                time_only = pd.to_datetime(time_str)
-                # If time is between 0-12, assume it's AM of the current day
-                # If time is between 12-24, assume it's PM of the current day
-                if time_only.hour < 12:
-                    return pd.Timestamp.now().normalize() + pd.Timedelta(hours=time_only.hour, 
-                                                                       minutes=time_only.minute,
-                                                                       seconds=time_only.second)
-                else:
-                    return pd.Timestamp.now().normalize() + pd.Timedelta(hours=time_only.hour, 
-                                                                       minutes=time_only.minute,
-                                                                       seconds=time_only.second)
-            except:
-                if 'Date' in str(date_str) or 'Time' in str(date_str):
-                    return None
-                print(f"Warning: Could not parse datetime: {date_str} {time_str}")
-                return None  # Return None instead of current time for invalid data
+# Session plots are saved here; one figure is reused for every session
+PLOTS_FOLDER = 'plots'
+fig, ax = plt.subplots(figsize=(12, 6))
 
-def clean_temperature_data(value):
-    """Clean and convert temperature data to numeric values"""
-    if pd.isna(value):
-        return np.nan
-    
-    # If the value is already numeric, return it
-    if isinstance(value, (int, float)):
-        return value
-    
-    # If it's a string, try to extract the first number
-    try:
-        # Split by any non-numeric character and take the first valid number
-        parts = ''.join(c if c.isdigit() or c == '.' else ' ' for c in str(value)).split()
-        if parts:
-            val = float(parts[0])
-            # Filter out unrealistic values
-            if val < 0 or val > 150:  # Temperature range check
-                return np.nan
-            return val
-    except:
-        pass
-    
-    return np.nan
+def clean_temperature_series(series):
+    """Clean and convert a temperature column to numeric values"""
+    # Extract the first number from each cell, then mask unrealistic values
+    values = pd.to_numeric(series.astype(str).str.extract(NUM_RE, expand=False), errors='coerce')
+    return values.mask((values < 0) | (values > 150))
 
-def plot_session_temperatures(df, session_name):
-    """Create a temperature plot for a single session"""
+def plot_session_temperatures(resampled, session_name, out):
+    """Create a temperature plot for a single session, reporting problems to out"""
     try:
-        # Get GPU temperature columns
-        gpu_temp_cols = [col for col in df.columns if 'gpu' in col.lower() and ('temperature' in col.lower() or 'temp' in col.lower())]
-        
-        if not gpu_temp_cols:
-            print(f"No GPU temperature data found for session {session_name}")
+        if resampled.empty:
+            print(f"No GPU temperature data found for session {session_name}", file=out)
             return
         
-        plt.figure(figsize=(12, 6))
+        # Reuse the shared figure instead of allocating a new one per session
+        ax.clear()
         
-        for col in gpu_temp_cols:
-            # Clean and prepare the data
-            temp_data = df[col].apply(clean_temperature_data)
-            temp_data = temp_data.dropna()
+        # All columns were resampled to 1-minute intervals in a single pass
+        for col in resampled.columns:
+            temp_data = resampled[col]
             
             # Skip if no valid data
-            if len(temp_data) == 0:
+            if temp_data.isna().all():
                 continue
-                
-            # Resample data to reduce noise (1-minute intervals)
-            temp_data = temp_data.resample('1min').mean()
             
             # Skip if all values are the same (likely corrupted data)
             if temp_data.min() == temp_data.max():
                 continue
             
             # Plot the data
-            plt.plot(temp_data.index, temp_data, label=col.replace('[°C]', '').strip(), alpha=0.8)
+            ax.plot(temp_data.index, temp_data, label=col.replace('[°C]', '').strip(), alpha=0.8)
         
         # Configure x-axis to show time in HH:MM format
-        plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%H:%M'))
         
         # Set appropriate time intervals
-        time_range = df.index.max() - df.index.min()
-        if time_range.total_seconds() <= 1800:  # Less than 30 minutes
-            plt.gca().xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
-        elif time_range.total_seconds() <= 3600:  # Less than 1 hour
-            plt.gca().xaxis.set_major_locator(mdates.MinuteLocator(interval=10))
+        # The resampled index is sorted, so its ends give the session span
+        total_seconds = (resampled.index[-1] - resampled.index[0]).total_seconds()
+        if total_seconds <= 1800:  # Less than 30 minutes
+            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=5))
+        elif total_seconds <= 3600:  # Less than 1 hour
+            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=10))
         else:
-            plt.gca().xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
+            ax.xaxis.set_major_locator(mdates.MinuteLocator(interval=15))
         
-        plt.title(f'GPU Temperatures - {session_name}')
-        plt.xlabel('Time (HH:MM)')
-        plt.ylabel('Temperature (°C)')
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.grid(True)
+        ax.set_title(f'GPU Temperatures - {session_name}')
+        ax.set_xlabel('Time (HH:MM)')
+        ax.set_ylabel('Temperature (°C)')
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        ax.grid(True)
         
         # Set y-axis limits to show reasonable temperature range
-        plt.ylim(40, 90)
+        ax.set_ylim(40, 90)
         
         # Rotate x-axis labels for better readability
-        plt.xticks(rotation=45)
+        ax.tick_params(axis='x', labelrotation=45)
         
-        plt.tight_layout()
-        plt.show()
+        fig.tight_layout()
+        fig.savefig(os.path.join(PLOTS_FOLDER, f"{session_name}.png"), dpi=100, bbox_inches='tight')
         
     except Exception as e:
-        print(f"\nError creating plot for session {session_name}: {str(e)}")
+        print(f"\nError creating plot for session {session_name}: {str(e)}", file=out)
 
-def analyze_temperatures(df, session_name):
-    """Analyze temperature patterns for a single session"""
+def analyze_temperatures(cleaned, gpu_temp_cols, session_name, out):
+    """Analyze temperature patterns for a single session, writing the report to out"""
     try:
-        print(f"\n🌡️ Temperature Analysis for {session_name}")
-        print("=" * 50)
-        
-        # Get GPU temperature columns
-        gpu_temp_cols = [col for col in df.columns if 'gpu' in col.lower() and ('temperature' in col.lower() or 'temp' in col.lower())]
+        print(f"\n🌡️ Temperature Analysis for {session_name}", file=out)
+        print("=" * 50, file=out)
         
         # Analyze GPU temperatures
         if gpu_temp_cols:
-            print("\nGPU Temperature Analysis:")
+            print("\nGPU Temperature Analysis:", file=out)
             for col in gpu_temp_cols:
                 try:
-                    # Clean the temperature data
-                    temp_data = df[col].apply(clean_temperature_data)
-                    
                     # Remove any NaN values
-                    temp_data = temp_data.dropna()
+                    temp_data = cleaned[col].dropna()
                     
                     if len(temp_data) == 0:
-                        print(f"\n{col}: No valid temperature data found")
+                        print(f"\n{col}: No valid temperature data found", file=out)
                         continue
                     
-                    avg_temp = temp_data.mean()
-                    max_temp = temp_data.max()
-                    min_temp = temp_data.min()
-                    
-                    # Find times of high and low temperatures
-                    high_temp_threshold = avg_temp + (max_temp - avg_temp) * 0.8
-                    low_temp_threshold = avg_temp - (avg_temp - min_temp) * 0.8
+                    # Compute all summary statistics in a single pass
+                    stats = temp_data.agg(['mean', 'max', 'min'])
+                    avg_temp, max_temp, min_temp = stats['mean'], stats['max'], stats['min']
                     
-                    high_temp_times = temp_data[temp_data >= high_temp_threshold].index
-                    low_temp_times = temp_data[temp_data <= low_temp_threshold].index
+                    print(f"\n{col}:", file=out)
+                    print(f"  Average: {avg_temp:.1f}°C", file=out)
+                    print(f"  Maximum: {max_temp:.1f}°C", file=out)
+                    print(f"  Minimum: {min_temp:.1f}°C", file=out)
                     
-                    print(f"\n{col}:")
-                    print(f"  Average: {avg_temp:.1f}°C")
-                    print(f"  Maximum: {max_temp:.1f}°C")
-                    print(f"  Minimum: {min_temp:.1f}°C")
+                    # Show the hottest and coolest readings of the session
+                    print("\n  High Temperature Periods:", file=out)
+                    for time, value in temp_data.nlargest(5).items():
+                        print(f"    {time.strftime('%H:%M:%S')} - {value:.1f}°C", file=out)
                     
-                    if not high_temp_times.empty:
-                        print("\n  High Temperature Periods:")
-                        for time in high_temp_times[:5]:
-                            try:
-                                print(f"    {time.strftime('%H:%M:%S')} - {temp_data[time]:.1f}°C")
-                            except:
-                                continue
-                    
-                    if not low_temp_times.empty:
-                        print("\n  Low Temperature Periods:")
-                        for time in low_temp_times[:5]:
-                            try:
-                                print(f"    {time.strftime('%H:%M:%S')} - {temp_data[time]:.1f}°C")
-                            except:
-                                continue
+                    print("\n  Low Temperature Periods:", file=out)
+                    for time, value in temp_data.nsmallest(5).items():
+                        print(f"    {time.strftime('%H:%M:%S')} - {value:.1f}°C", file=out)
                 except Exception as e:
-                    print(f"\nError analyzing {col}: {str(e)}")
+                    print(f"\nError analyzing {col}: {str(e)}", file=out)
     except Exception as e:
-        print(f"\nError analyzing session {session_name}: {str(e)}")
+        print(f"\nError analyzing session {session_name}: {str(e)}", file=out)
 
-# Read the CSV files
-data_folder = 'Data'
-csv_files = glob.glob(os.path.join(data_folder, '*.csv'))
+def read_session_csv(file, encoding):
+    """Open a session log for chunked reading of its Date, Time and GPU temperature columns"""
+    preview = pd.read_csv(file, nrows=1, encoding=encoding, on_bad_lines='skip')
+    header = preview.columns
+    if 'Date' not in header or 'Time' not in header:
+        return None
+    
+    gpu_temp_cols = [col for col in header if 'gpu' in col.lower() and 'temp' in col.lower()]
+    
+    # Let the parser skip a repeated header row instead of filtering it afterwards
+    skiprows = None
+    if not preview.empty and preview['Date'].iloc[0] == 'Date':
+        skiprows = [1]
+    
+    # Fall back to a full read if no GPU temperature columns were found
+    if not gpu_temp_cols:
+        return pd.read_csv(file, skiprows=skiprows, chunksize=CHUNK_SIZE,
+                           encoding=encoding, on_bad_lines='skip')
+    
+    keep = ['Date', 'Time'] + gpu_temp_cols
+    return pd.read_csv(file, usecols=keep, dtype={col: 'string' for col in keep}, skiprows=skiprows,
+                       chunksize=CHUNK_SIZE, encoding=encoding, on_bad_lines='skip')
+
+def prepare_chunk(df):
+    """Index a chunk of a session log by time and clean its GPU temperature columns"""
+    # Arrow-backed strings are smaller and faster for the .str operations below
+    if HAS_PYARROW:
+        df = df.convert_dtypes(dtype_backend='pyarrow')
+    
+    # Create DateTime column in one vectorized pass, falling back to
+    # generic parsing only for the rows the HWiNFO format did not match
+    combined = df['Date'].astype(str).str.cat(df['Time'].astype(str), sep=' ')
+    date_time = pd.to_datetime(combined, format='%d.%m.%Y %H:%M:%S.%f', errors='coerce')
+    if date_time.isna().any():
+        fallback = pd.to_datetime(combined[date_time.isna()], errors='coerce')
+        date_time = date_time.fillna(fallback)
+    df['DateTime'] = date_time
+    
+    # Remove rows with invalid timestamps before setting index; any
+    # leftover header or garbage rows were coerced to NaT above
+    df = df.dropna(subset=['DateTime'])
+    
+    # Set the index after cleaning the data
+    df = df.set_index('DateTime')
+    
+    # Clean the GPU temperature columns once for both analysis and plotting
+    gpu_temp_cols = [col for col in df.columns if 'gpu' in col.lower() and 'temp' in col.lower()]
+    return pd.DataFrame({col: clean_temperature_series(df[col]) for col in gpu_temp_cols},
+                        index=df.index).dropna(how='all').astype('float32')
 
-# Process each file separately
-for file in csv_files:
+def load_session(file, encoding):
+    """Read a session log chunk by chunk, keeping only the cleaned GPU temperatures"""
+    reader = read_session_csv(file, encoding)
+    if reader is None:
+        return None
+    
+    # Only the small cleaned frames are kept, so the raw text of at most
+    # one chunk is held in memory at a time
+    with reader:
+        parts = [prepare_chunk(chunk) for chunk in reader]
+    return pd.concat(parts) if parts else None
+
+def process_file(file):
+    """Analyze and plot a single session log, returning its report as one string"""
+    # Workers run concurrently, so collect the report here and let the
+    # parent print whole reports instead of interleaved lines
+    out = io.StringIO()
     try:
-        df = pd.read_csv(file, encoding='utf-8', on_bad_lines='skip')
+        cleaned = load_session(file, 'utf-8')
     except UnicodeDecodeError:
         try:
-            df = pd.read_csv(file, encoding='latin1', on_bad_lines='skip')
+            cleaned = load_session(file, 'latin1')
         except Exception as e:
-            print(f"Could not read file {file}: {str(e)}")
-            continue
+            print(f"Could not read file {file}: {str(e)}", file=out)
+            return out.getvalue()
     
     session_name = os.path.basename(file).replace('.CSV', '')
     
-    if 'Date' in df.columns and 'Time' in df.columns:
-        # Drop header rows
-        df = df[~df['Date'].str.contains('Date', na=False)]
-        
-        # Create DateTime column
-        df['DateTime'] = df.apply(lambda row: parse_datetime(row['Date'], row['Time']), axis=1)
-        
-        # Remove rows with invalid timestamps before setting index
-        df = df.dropna(subset=['DateTime'])
+    if cleaned is not None:
+        if DEBUG:
+            print(f"{session_name}: cleaned data uses {cleaned.memory_usage(deep=True).sum() / 1e6:.2f} MB", file=out)
         
-        # Set the index after cleaning the data
-        df = df.set_index('DateTime')
+        # Resample data to reduce noise (1-minute intervals)
+        resampled = cleaned.resample('1min').mean()
         
         # Analyze and plot the session
-        analyze_temperatures(df, session_name)
-        plot_session_temperatures(df, session_name) 
\ No newline at end of file
+        analyze_temperatures(cleaned, list(cleaned.columns), session_name, out)
+        plot_session_temperatures(resampled, session_name, out)
+    
+    return out.getvalue()
+
+if __name__ == '__main__':
+    # Read the CSV files
+    data_folder = 'Data'
+    csv_files = glob.glob(os.path.join(data_folder, '*.csv'))
+    os.makedirs(PLOTS_FOLDER, exist_ok=True)
+    
+    # Process each file in its own worker process, printing the reports in file order
+    with ProcessPoolExecutor() as executor:
+        for report in executor.map(process_file, csv_files):
+            print(report, end='')